@@ -4,14 +4,29 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import random
-import time
-
+import io
+import os
+import hashlib
+import inspect
+import threading
+from collections import OrderedDict
+
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
-import seaborn as sns
+from joblib import Parallel, delayed
+
+import _kernels
+from _kernels import (HAVE_NUMBA, run_all_nb, simulate_chunk_np,
+                      simulate_matings_nb, simulate_matings_np)
 
 # --- Simulation Functions ---
+def _base_seed(seed=None):
+    """Turns any seed (or None) into a 31-bit integer that Numba's `np.random.seed` accepts."""
+    return int(np.random.SeedSequence(seed).generate_state(1)[0] >> 1)
+
 def simulate_matings(n_females=10, target_pregnancies=1, 
-                     pregnancy_chance=0.091, pregnant_chance=0.0):
+                     pregnancy_chance=0.091, pregnant_chance=0.0, seed=None, fast_mode=False):
     """
     Simulates a guinea pig lovefest until a set number of pregnancies occur.
 
@@ -20,35 +35,87 @@ def simulate_matings(n_females=10, target_pregnancies=1,
     - target_pregnancies (int): How many successful snuggles should lead to pregnancies.
     - pregnancy_chance (float): Chance of baby-making success with an unpregnant pig.
     - pregnant_chance (float): Chance of impregnating a pig who’s already preggers (typically zero).
+    - seed (int or None): Seed for the random number generator, for reproducible romance.
+    - fast_mode (bool): Sample the outcome directly instead of replaying every attempt.
 
     Returns:
-    - dict: A record of each female's total snuggle sessions, split by pregnancy status.
+    - np.ndarray: Shaped (3, n_females); the rows hold each female's total snuggle sessions,
+      followed by the sessions while pregnant and while not pregnant.
     """
-    knocked_up = set()
-    shag_stats = {
-        sow: {'total': 0, 'while_pregnant': 0, 'while_unpregnant': 0}
-        for sow in range(n_females)
-    }
+    if fast_mode:
+        return _sample_stats_fast(n_females, target_pregnancies, 1, pregnancy_chance, seed)[:, 0]
+
+    stats = np.empty((3, n_females), dtype=np.int32)
+    if HAVE_NUMBA:
+        simulate_matings_nb(n_females, target_pregnancies, pregnancy_chance,
+                            pregnant_chance, _base_seed(seed), stats)
+    else:
+        simulate_matings_np(n_females, target_pregnancies, pregnancy_chance, _base_seed(seed), stats)
+    return stats
+
+def _sample_stats_fast(n_females, target, simulations, p_unpreg, seed=None):
+    """
+    Samples the outcome of every simulation at once, without replaying each mating attempt.
+
+    Picture each sow being courted at rate 1 in continuous time: Randy's attempts, in order,
+    are then exactly the uniform picks of the simulation. Her successful snuggles arrive at
+    rate `p_unpreg`, so her conception time is exponential and the spree ends at the
+    `target`-th conception. Given those times, her failed sessions before conceiving and her
+    sessions while pregnant are independent Poisson counts, which reproduces the distribution
+    of the attempt-by-attempt simulation exactly.
+
+    Returns:
+    - np.ndarray: Total, while-pregnant and while-unpregnant counts, shaped (3, simulations, n_females).
+    """
+    target = min(target, n_females)
+    if target <= 0:
+        # Randy's done before he starts, just like the attempt-by-attempt simulation
+        return np.zeros((3, simulations, n_females), dtype=np.int32)
+
+    rng = np.random.Generator(np.random.PCG64(seed))
+
+    conceived_at = rng.exponential(1 / p_unpreg, size=(simulations, n_females))
+    spree_end = np.partition(conceived_at, target - 1, axis=1)[:, target - 1:target]
+    pregnant = conceived_at <= spree_end
+    unpregnant_until = np.minimum(conceived_at, spree_end)
+
+    stats = np.empty((3, simulations, n_females), dtype=np.int32)
+    stats[1] = rng.poisson(spree_end - unpregnant_until)
+    stats[2] = rng.poisson((1 - p_unpreg) * unpregnant_until) + pregnant
+    stats[0] = stats[1] + stats[2]
+    return stats
+
+def _simulate_stats(n_females, target_pregnancies, simulations,
+                    pregnancy_chance, pregnant_chance, seed, fast_mode=False):
+    """
+    Runs all simulations for one population with whichever engine is available.
+
+    Simulations are independent, so they are spread over every CPU core: by Numba's prange,
+    or by joblib worker processes that each take a chunk of simulations when Numba is missing.
+    Either way simulation `i` is seeded with `base + i`, so results don't depend on the split.
 
-    while len(knocked_up) < min(target_pregnancies, n_females):
-        lucky_sow = random.randint(0, n_females - 1)
-        already_preggers = lucky_sow in knocked_up
-        conception_odds = pregnant_chance if already_preggers else pregnancy_chance
+    Returns:
+    - np.ndarray: Total, while-pregnant and while-unpregnant counts, shaped (3, simulations, n_females).
+    """
+    if fast_mode:
+        return _sample_stats_fast(n_females, target_pregnancies, simulations, pregnancy_chance, seed)
 
-        shag_stats[lucky_sow]['total'] += 1
-        if already_preggers:
-            shag_stats[lucky_sow]['while_pregnant'] += 1
-        else:
-            shag_stats[lucky_sow]['while_unpregnant'] += 1
+    base_seed = _base_seed(seed)
 
-        if not already_preggers and random.random() < conception_odds:
-            knocked_up.add(lucky_sow)
+    if HAVE_NUMBA:
+        stats = run_all_nb(np.array([n_females], dtype=np.int64), target_pregnancies, simulations,
+                           pregnancy_chance, pregnant_chance, np.array([base_seed], dtype=np.int64))
+        return stats.reshape(3, simulations, n_females)
 
-    return shag_stats
+    n_jobs = min(simulations, os.cpu_count() or 1)
+    chunks = Parallel(n_jobs=n_jobs)(
+        delayed(simulate_chunk_np)(n_females, target_pregnancies, pregnancy_chance, base_seed, sims)
+        for sims in np.array_split(np.arange(simulations), n_jobs)
+    )
+    return np.concatenate(chunks, axis=1)
 
-@st.cache_data(show_spinner=True)
 def run_simulations(n_females=10, target_pregnancies=1, simulations=100, 
-                    pregnancy_chance=0.091, pregnant_chance=0.0):
+                    pregnancy_chance=0.091, pregnant_chance=0.0, seed=None, fast_mode=False):
     """
     Runs the guinea pig mating simulation multiple times to analyze snuggle stats.
 
@@ -58,30 +125,273 @@ def run_simulations(n_females=10, target_pregnancies=1, simulations=100,
     - simulations (int): Total number of times we run the guinea pig dating experiment.
     - pregnancy_chance (float): Probability of pregnancy if unpregnant.
     - pregnant_chance (float): Probability of pregnancy if already pregnant (should be zero).
+    - seed (int or None): Seed from which every simulation's seed is derived.
+    - fast_mode (bool): Sample each simulation's outcome directly instead of replaying every attempt.
 
     Returns:
     - pd.DataFrame: A log of piggy passion across all simulations.
     """
-    all_matings = []
+    total, while_preg, while_unpreg = _simulate_stats(
+        n_females, target_pregnancies, simulations, pregnancy_chance, pregnant_chance, seed, fast_mode
+    )
 
-    for sim in range(simulations):
-        session_log = simulate_matings(
-            n_females=n_females,
-            target_pregnancies=target_pregnancies,
-            pregnancy_chance=pregnancy_chance,
-            pregnant_chance=pregnant_chance
-        )
+    # Each simulation's counts sit in one contiguous row, so the columns are flat views
+    return pd.DataFrame({
+        'Simulation': np.repeat(np.arange(simulations, dtype=np.int32), n_females),
+        'Female': np.tile(np.arange(n_females, dtype=np.int32), simulations),
+        'Mating Count': total.ravel(),
+        'Shagged while Pregnant': while_preg.ravel(),
+        'Shagged while not Pregnant': while_unpreg.ravel()
+    })
+
+POPULATION_CACHE_SIZE = 32  # Populations whose raw counts stay in memory, shared by all sessions
+
+@st.cache_resource
+def _population_cache():
+    """
+    Holds each population's raw counts for the lifetime of the app process, shared by all sessions.
+
+    Returns:
+    - tuple: An OrderedDict from (population, parameters) to counts, least recently used first,
+      and the lock guarding it.
+    """
+    return OrderedDict(), threading.Lock()
+
+def _population_seed(seed, pop):
+    """Derives a population's own seed, so its results don't depend on which others were selected."""
+    return int(np.random.SeedSequence(seed, spawn_key=(pop,)).generate_state(1)[0])
+
+def _simulate_population_stats(population_sizes, target_pregnancies, simulations,
+                               pregnancy_chance, pregnant_chance, seed, fast_mode):
+    """
+    Fetches each population's counts from the process-wide cache, simulating only the missing ones.
+
+    Toggling one population in the sidebar therefore only simulates that population, while
+    the others come straight from memory.
+
+    Returns:
+    - list of np.ndarray: Total, while-pregnant and while-unpregnant counts per population,
+      each shaped (3, simulations * n_females).
+    """
+    cache, lock = _population_cache()
+    params = (target_pregnancies, simulations, pregnancy_chance, pregnant_chance,
+              seed, fast_mode, ENGINE_VERSION)
+    with lock:
+        found = {pop: cache[(pop, params)] for pop in population_sizes if (pop, params) in cache}
+    missing = [pop for pop in population_sizes if pop not in found]
+
+    if missing and HAVE_NUMBA and not fast_mode:
+        # A single kernel call runs every missing population's simulations in one parallel
+        # sweep, so no core sits idle waiting for the next population to start
+        stats = run_all_nb(np.array(missing, dtype=np.int64), target_pregnancies, simulations,
+                           pregnancy_chance, pregnant_chance,
+                           np.array([_base_seed(_population_seed(seed, pop)) for pop in missing],
+                                    dtype=np.int64))
+        blocks = np.split(stats, np.cumsum([simulations * pop for pop in missing])[:-1], axis=1)
+    else:
+        blocks = [
+            _simulate_stats(pop, target_pregnancies, simulations, pregnancy_chance,
+                            pregnant_chance, _population_seed(seed, pop), fast_mode).reshape(3, -1)
+            for pop in missing
+        ]
+    found.update(zip(missing, blocks))
+
+    with lock:
+        for pop in population_sizes:
+            cache[(pop, params)] = found[pop]
+            cache.move_to_end((pop, params))
+        while len(cache) > POPULATION_CACHE_SIZE:
+            cache.popitem(last=False)
+    return [found[pop] for pop in population_sizes]
+
+def _engine_version():
+    """
+    Fingerprints the source of the simulation engines.
+
+    Streamlit keys `simulate_populations`' cache on that function's own source only, so results
+    persisted to disk would otherwise outlive changes to the engines it calls.
+    """
+    sources = [inspect.getsource(_kernels)] + [
+        inspect.getsource(func) for func in (_base_seed, _sample_stats_fast, _simulate_stats,
+                                             _population_seed, _simulate_population_stats)
+    ]
+    return hashlib.sha256(''.join(sources).encode()).hexdigest()[:16]
+
+ENGINE_VERSION = _engine_version()
+
+@st.cache_data(persist="disk", max_entries=8, show_spinner=False)
+def simulate_populations(population_sizes, target_pregnancies=1, simulations=100,
+                         pregnancy_chance=0.091, pregnant_chance=0.0, seed=None, fast_mode=False,
+                         engine_version=None):
+    """
+    Runs the guinea pig mating simulations for several population sizes in one go.
+
+    Parameters:
+    - population_sizes (tuple of int): Numbers of female guinea pigs to simulate.
+    - target_pregnancies (int): Baby bumps required to end each mating spree.
+    - simulations (int): Number of simulations per population.
+    - pregnancy_chance (float): Probability of pregnancy if unpregnant.
+    - pregnant_chance (float): Probability of pregnancy if already pregnant (should be zero).
+    - seed (int or None): Seed from which every population's own seed is derived.
+    - fast_mode (bool): Sample each simulation's outcome directly instead of replaying every attempt.
+    - engine_version (str or None): Only part of the cache key; pass `ENGINE_VERSION` so cached
+      results are dropped whenever the engines change.
+
+    Returns:
+    - pd.DataFrame: The `run_simulations` logs of all populations, with a categorical 'Population' column.
+    """
+    stats = np.concatenate(_simulate_population_stats(
+        population_sizes, target_pregnancies, simulations,
+        pregnancy_chance, pregnant_chance, seed, fast_mode
+    ), axis=1)
+
+    # Each column is only as wide as its largest value needs: with the sidebar's ranges the
+    # keys and counts all fit in two bytes, which halves what the cache has to pickle
+    rows_per_pop = [simulations * pop for pop in population_sizes]
+    key_dtype = np.min_scalar_type(max([simulations, *population_sizes]) - 1)
+    # Each population's counts already sit in one block of rows, simulation by simulation,
+    # so they become the count columns directly: no per-population frames and no concat
+    total, while_preg, while_unpreg = stats.astype(np.min_scalar_type(int(stats[0].max())))
+    columns = {
+        'Simulation': np.empty(stats.shape[1], dtype=key_dtype),
+        'Female': np.empty(stats.shape[1], dtype=key_dtype),
+        'Mating Count': total,
+        'Shagged while Pregnant': while_preg,
+        'Shagged while not Pregnant': while_unpreg
+    }
+    offset = 0
+    for pop, n_rows in zip(population_sizes, rows_per_pop):
+        rows = slice(offset, offset + n_rows)
+        columns['Simulation'][rows] = np.repeat(np.arange(simulations), pop)
+        columns['Female'][rows] = np.tile(np.arange(pop), simulations)
+        offset += n_rows
+
+    columns['Population'] = pd.Categorical.from_codes(
+        np.repeat(np.arange(len(population_sizes)), rows_per_pop), categories=population_sizes
+    )
+    return pd.DataFrame(columns, copy=False)
+
+def expected_attempts(n_females, target_pregnancies, pregnancy_chance):
+    """
+    Calculates the exact expected number of shagging attempts, no simulation required.
+
+    With `k` females already pregnant, an attempt hits an unpregnant female with chance
+    (n - k) / n and then succeeds with `pregnancy_chance`, so the wait for the next
+    pregnancy is geometric. Summing those waits gives the coupon-collector expectation.
+
+    Parameters:
+    - n_females (int): Number of female guinea pigs.
+    - target_pregnancies (int): Baby bumps required to end the mating spree.
+    - pregnancy_chance (float): Probability of pregnancy if unpregnant.
+
+    Returns:
+    - float: Expected total number of mating attempts.
+    """
+    already_pregnant = np.arange(min(target_pregnancies, n_females))
+    return np.sum(n_females / (n_females - already_pregnant)) / pregnancy_chance
+
+def _count_frequencies(counts):
+    """
+    Tallies how many females in each simulation ended up with each shag count.
+
+    Parameters:
+    - counts (np.ndarray): Shag counts per female, shaped (simulations, n_females).
 
-        for sow_id, stats in session_log.items():
-            all_matings.append({
-                'Simulation': sim,
-                'Female': sow_id,
-                'Mating Count': stats['total'],
-                'Shagged while Pregnant': stats['while_pregnant'],
-                'Shagged while not Pregnant': stats['while_unpregnant']
-            })
+    Returns:
+    - tuple of np.ndarray: Simulation index, shag count and number of females for every
+      (simulation, shag count) pair that actually occurred.
+    """
+    simulations = counts.shape[0]
+    n_bins = int(counts.max()) + 1
+    # Shifting each simulation into its own range of bins turns all the
+    # per-simulation histograms into a single bincount
+    offsets = (np.arange(simulations) * n_bins)[:, None]
+    freq = np.bincount((counts + offsets).ravel(), minlength=simulations * n_bins)
+    observed = np.flatnonzero(freq)
+    sims, shag_counts = np.divmod(observed, n_bins)
+    return sims, shag_counts, freq[observed]
+
+# --- Plotting Functions ---
+def _fig_to_png(fig):
+    """Renders a figure to PNG bytes and closes it, so reruns don't pile up open figures."""
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=100, bbox_inches='tight')
+    plt.close(fig)
+    return buffer.getvalue()
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def plot_attempts_histogram(attempts, populations):
+    """
+    Plots how many shagging attempts each simulation needed, coloured by population.
 
-    return pd.DataFrame(all_matings)
+    Parameters:
+    - attempts (np.ndarray): Total shagging attempts of each simulation.
+    - populations (np.ndarray): Population size of each simulation.
+
+    Returns:
+    - bytes: The histogram as a PNG image.
+    """
+    # Shared bin edges keep the populations' bars comparable
+    edges = np.histogram_bin_edges(attempts, bins=50)
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    for pop in np.unique(populations):
+        counts, _ = np.histogram(attempts[populations == pop], bins=edges)
+        ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', alpha=0.6, label=str(pop))
+    ax.legend(title='Population')
+    ax.set_title('Distribution of Shagging Attempts')
+    ax.set_xlabel('Shagging Attempts')
+    ax.set_ylabel('Shagging Attempt Frequency')
+    return _fig_to_png(fig)
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def plot_shag_histogram(shag_freq, pop):
+    """
+    Plots how often the females of one population got shagged.
+
+    Parameters:
+    - shag_freq (np.ndarray): Number of females per total shag count, as given by `np.bincount`.
+    - pop (int): Population size, used in the title.
+
+    Returns:
+    - bytes: The histogram as a PNG image.
+    """
+    # Shag counts are whole numbers, so about 50 bars of whole-count runs, starting at
+    # the lowest count seen, keeps every bar the same width
+    lowest = np.flatnonzero(shag_freq)[0]
+    width = -(-(len(shag_freq) - lowest) // 50)
+    edges = np.arange(lowest, len(shag_freq) + width, width)
+    counts = np.add.reduceat(shag_freq, edges[:-1])
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge')
+    ax.set_title(f"Distribution of Shag Counts per Female — Population {pop}")
+    ax.set_xlabel("Number of Shags per Female")
+    ax.set_ylabel("Frequency of a Female with a certain number of Shags")
+    return _fig_to_png(fig)
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def plot_shag_types(stats, pop):
+    """
+    Plots the mean number of females per shag count, split by pregnancy status.
+
+    Parameters:
+    - stats (pd.DataFrame): 'mean', 'ci_lo' and 'ci_hi' per 'Mating Type' and 'Shag_counts'.
+    - pop (int): Population size, used in the title.
+
+    Returns:
+    - bytes: The line plot as a PNG image.
+    """
+    fig, ax = plt.subplots(figsize=(10, 6))
+    for mating_type, line in stats.groupby('Mating Type', observed=True):
+        lines = ax.plot(line['Shag_counts'], line['mean'], label=mating_type)
+        ax.fill_between(line['Shag_counts'], line['ci_lo'], line['ci_hi'],
+                        color=lines[0].get_color(), alpha=0.2)
+    ax.legend(title='Mating Type')
+    ax.set_title(f"Distribution of Shag Counts by Type — Population {pop}")
+    ax.set_xlabel("Number of Shags")
+    ax.set_ylabel("Frequency")
+    return _fig_to_png(fig)
 
 # --- Streamlit UI ---
 st.title("🐹 Guinea Pig Shagging Simulator")
@@ -105,12 +415,17 @@ Enjoy!
 
 # Sidebar Inputs
 st.sidebar.header("Simulation Parameters")
-population_sizes = st.sidebar.multiselect(
+# Sorted, so picking the same populations in another order hits the same cache entry
+population_sizes = sorted(st.sidebar.multiselect(
     "Select Population Sizes", [50, 100, 200, 300, 400], default=[100, 300]
-)
+))
 simulations = st.sidebar.slider("Number of Simulations", 10, 500, 100, step=10)
 target_pregnancies = st.sidebar.number_input("Target Pregnancies", 1, 500, 100)
 pregnancy_chance = st.sidebar.slider("Pregnancy Chance", 0.01, 0.5, 0.091, 0.005)
+fast_mode = st.sidebar.checkbox(
+    "Fast Mode", value=False,
+    help="Samples each simulation's outcome in one go instead of replaying every shag. Same statistics, a fraction of the time."
+)
 
 pun_messages = [
     "Crunching numbers... grip your hay bales, it's mating math madness 🌾💘",
@@ -136,39 +451,40 @@ pun_messages = [
 
 if st.sidebar.button("Run Simulation"):
     message1, message2, message3 = random.sample(pun_messages, 3)
-    st.write(message1)
-    time.sleep(2)
-    st.write(message2)
-    time.sleep(2)
-    st.write(message3)
-    time.sleep(3)
-
-    frames = []
-    for pop in population_sizes:
-        df = run_simulations(
-            n_females=pop,
+    # The status box is the progress indicator, so the cached sweep doesn't add a spinner of its own
+    with st.status("Randy is warming up... 🐹", expanded=True) as status:
+        status.write(message1)
+        mate_df = simulate_populations(
+            tuple(population_sizes),
             target_pregnancies=target_pregnancies,
             simulations=simulations,
-            pregnancy_chance=pregnancy_chance
+            # Slider steps come back as floats like 0.10600000000000001; rounding keeps
+            # the cache key the same for the same setting
+            pregnancy_chance=round(pregnancy_chance, 4),
+            fast_mode=fast_mode,
+            engine_version=ENGINE_VERSION
         )
-        df['Population'] = pop
-        frames.append(df)
-
-    mate_df = pd.concat(frames, ignore_index=True)
-
-    melted_df = mate_df.melt(
-        id_vars=['Population','Simulation', 'Female'],
-        value_vars=['Shagged while Pregnant', 'Shagged while not Pregnant'],
-        var_name='Mating Type',
-        value_name='Shag_counts'
-    )
-
-    frequency_table = (
-        melted_df
-        .groupby(['Population','Simulation', 'Mating Type', 'Shag_counts'])
-        .size()
-        .reset_index(name='Num Females')
-    )
+        status.write(message2)
+
+        freq_frames = []
+        for pop, df in mate_df.groupby('Population', sort=False, observed=True):
+            for mating_type in ['Shagged while Pregnant', 'Shagged while not Pregnant']:
+                sims, shag_counts, num_females = _count_frequencies(
+                    df[mating_type].to_numpy().reshape(simulations, pop)
+                )
+                freq_frames.append(pd.DataFrame({
+                    'Population': pop,
+                    'Simulation': sims,
+                    'Mating Type': mating_type,
+                    'Shag_counts': shag_counts,
+                    'Num Females': num_females
+                }))
+
+        frequency_table = pd.concat(freq_frames, ignore_index=True)
+        frequency_table['Population'] = frequency_table['Population'].astype('category')
+        frequency_table['Mating Type'] = frequency_table['Mating Type'].astype('category')
+        status.write(message3)
+        status.update(label="Done! Randy needs a nap 😴", state="complete", expanded=False)
 
     st.subheader("🧮 Evaluation of Shagging Reproduction")
     st.markdown("""
@@ -176,16 +492,24 @@ if st.sidebar.button("Run Simulation"):
     Caroline used a pregnancy chance of 9.1% (0.091) and contrasted a population of 100 and 300 Guinea Pigs with Randy needing to impregnate 100 females before Caroline stopped him and the simulation (because Randy doesn't quit. Ever.).
     The results Caroline found that, in order to get 100 pregnant guinea pics, 1330 shags were needed for a population of 300 females while 5700 shags were needed for a population of 100 Guinea Pigs.
     See for yourself if you think these simulations are close enough to her results.   
+    As a sanity check, the table also lists the exact expected number of shags, which follows from the coupon collector's problem without any simulating at all.
     """)
 
-    mean_attempts = (mate_df
-                     .groupby(['Simulation','Population'])
-                     ['Mating Count'].sum().reset_index()
-                     .groupby(['Population']).mean().reset_index()
-                     .drop('Simulation', axis=1)
-                     .rename(columns={'Mating Count': 'Mean Shagging Attempts'})
-                     .set_index('Population')
-    )
+    # Each population fills one contiguous block of simulations x population rows, so the
+    # attempts per simulation are just row sums of that block
+    mating_counts = mate_df['Mating Count'].to_numpy()
+    bounds = np.cumsum([0] + [simulations * pop for pop in population_sizes])
+    per_sim_total = np.stack([
+        mating_counts[start:end].reshape(simulations, -1).sum(axis=1)
+        for start, end in zip(bounds[:-1], bounds[1:])
+    ])
+    mean_attempts = pd.DataFrame({
+        'Mean Shagging Attempts': per_sim_total.mean(axis=1),
+        'Expected Shagging Attempts': [
+            expected_attempts(pop, target_pregnancies, pregnancy_chance)
+            for pop in population_sizes
+        ]
+    }, index=pd.Index(population_sizes, name='Population'))
     st.dataframe(mean_attempts)
 
     st.subheader("📊 Total Shagging Attempts per Population")
@@ -195,13 +519,10 @@ if st.sidebar.button("Run Simulation"):
     Each simulation with a population of 100 produces widely varying numbers on the amount of shags needed to reach 100 pregnancies.     
     """)
 
-    agg_df = mate_df.groupby(['Simulation', 'Population'])['Mating Count'].sum().reset_index()
-    fig2, ax2 = plt.subplots(figsize=(10, 6))
-    sns.histplot(data=agg_df, x='Mating Count', hue='Population', bins=50, alpha=0.6, ax=ax2)
-    ax2.set_title('Distribution of Shagging Attempts')
-    ax2.set_xlabel('Shagging Attempts')
-    ax2.set_ylabel('Shagging Attempt Frequency')
-    st.pyplot(fig2)
+    # Plain arrays hash far quicker than a DataFrame when Streamlit builds the cache key
+    st.image(plot_attempts_histogram(
+        per_sim_total.ravel(), np.repeat(population_sizes, simulations)
+    ))
 
     st.subheader("📊 Histogram of Shag Count per Female")
     st.markdown("""
@@ -209,21 +530,10 @@ if st.sidebar.button("Run Simulation"):
     How often did a female get shagged? What a clear difference between the different populations!
     """)
 
-    for pop in mate_df['Population'].unique():
+    for pop, subset in mate_df.groupby('Population', sort=False, observed=True):
         st.markdown(f"**Population {pop} Females**") 
-        fig, ax = plt.subplots(figsize=(10, 6))
-        subset = mate_df[mate_df['Population'] == pop]
-        sns.histplot(
-            data=subset,
-            x='Mating Count',
-            bins=50,
-            kde=False,
-            ax=ax
-        )
-        ax.set_title(f"Distribution of Shag Counts per Female — Population {pop}")
-        ax.set_xlabel("Number of Shags per Female")
-        ax.set_ylabel("Frequency of a Female with a certain number of Shags")
-        st.pyplot(fig)
+        # Tallying every female is cheap, and only the tally has to be hashed for the plot cache
+        st.image(plot_shag_histogram(np.bincount(subset['Mating Count'].to_numpy()), pop))
 
     st.subheader("📈 Distribution of Guinea Pig Shagging before and after getting Pregnate ([Yes yes, pregante! 📺](https://www.youtube.com/watch?v=EShUeudtaFg))")
     st.markdown("""
@@ -234,20 +544,18 @@ if st.sidebar.button("Run Simulation"):
     Therefore, let's have a look at the distribution of pregnant females having a shag. 
     """)
     
-    for pop in frequency_table['Population'].unique():
+    # Mean and 95% confidence band per shag count, computed once instead of bootstrapped per plot
+    freq_stats = (frequency_table
+                  .groupby(['Population', 'Mating Type', 'Shag_counts'], observed=True)
+                  ['Num Females'].agg(['mean', 'sem'])
+                  .reset_index())
+    ci = 1.96 * freq_stats['sem'].fillna(0)
+    freq_stats['ci_lo'] = freq_stats['mean'] - ci
+    freq_stats['ci_hi'] = freq_stats['mean'] + ci
+
+    for pop, subset in freq_stats.groupby('Population', sort=False, observed=True):
         st.markdown(f"**Population {pop} Females**")
-        fig, ax = plt.subplots(figsize=(10, 6))
-        subset = frequency_table[frequency_table['Population'] == pop]
-        sns.lineplot(data=subset,
-                    x='Shag_counts',
-                    y='Num Females',
-                    hue='Mating Type',
-                    errorbar='ci',
-                    ax=ax)
-        ax.set_title(f"Distribution of Shag Counts by Type — Population {pop}")
-        ax.set_xlabel("Number of Shags")
-        ax.set_ylabel("Frequency")
-        st.pyplot(fig)
+        st.image(plot_shag_types(subset, pop))
     
     st.subheader("Closing the simulation")
     st.markdown("""  
@@ -260,15 +568,18 @@ if st.sidebar.button("Run Simulation"):
 
     with st.expander("💡 **Click here** for more information on how these guinea pig shenanigans are coded"):
         st.markdown("""
-        This app simulates guinea pig shagging sessions until a target number of pregnancies is achieved. Two functions do the heavy lifting:
+        This app simulates guinea pig shagging sessions until a target number of pregnancies is achieved. Three functions do the heavy lifting:
 
         - `simulate_matings(...)`: simulates one round of shagging and returns snuggle stats per female.
         - `run_simulations(...)`: runs the above multiple times to provide meaningful distributions.
+        - `simulate_populations(...)`: does the same for every selected population size at once, into a single cached table.
+
+        The mean number of shags can also be calculated exactly with `expected_attempts(...)`, which the simulations are checked against.
 
         Here's how the functions are structured:
         ```python
         def simulate_matings(n_females=10, target_pregnancies=1, 
-                        pregnancy_chance=0.091, pregnant_chance=0.0):
+                        pregnancy_chance=0.091, pregnant_chance=0.0, seed=None, fast_mode=False):
             ""
             Simulates a guinea pig lovefest until a set number of pregnancies occur.
             
@@ -277,14 +588,16 @@ if st.sidebar.button("Run Simulation"):
             - target_pregnancies (int): How many successful snuggles should lead to pregnancies.
             - pregnancy_chance (float): Chance of baby-making success with an unpregnant pig.
             - pregnant_chance (float): Chance of impregnating a pig who's already preggers (typically zero).
+            - seed (int or None): Seed for the random number generator, for reproducible romance.
+            - fast_mode (bool): Sample the outcome directly instead of replaying every attempt.
             
             Returns:
-            - dict: A record of each female's total snuggle sessions, split by pregnancy status.
+            - np.ndarray: Shaped (3, n_females); the rows hold each female's total snuggle sessions,
+              followed by the sessions while pregnant and while not pregnant.
             ""
 
-        @st.cache_data(show_spinner=True)
         def run_simulations(n_females=10, target_pregnancies=1, simulations=100, 
-                            pregnancy_chance=0.091, pregnant_chance=0.0):
+                            pregnancy_chance=0.091, pregnant_chance=0.0, seed=None, fast_mode=False):
             ""
             Runs the guinea pig shagging simulation multiple times to analyze snuggle stats.
 
@@ -294,6 +607,8 @@ if st.sidebar.button("Run Simulation"):
             - simulations (int): Total number of times we run the guinea pig dating experiment.
             - pregnancy_chance (float): Probability of pregnancy if unpregnant.
             - pregnant_chance (float): Probability of pregnancy if already pregnant (should be zero).
+            - seed (int or None): Seed from which every simulation's seed is derived.
+            - fast_mode (bool): Sample each simulation's outcome directly instead of replaying every attempt.
 
             Returns:
             - pd.DataFrame: A log of piggy passion across all simulations.
@@ -0,0 +1,160 @@
+"""
+Compiled engines behind Randy's mating spree.
+
+They live in their own module rather than in the Streamlit script: Streamlit re-executes
+the script on every widget interaction, but imports this module only once per process, so
+the kernels are compiled (or loaded from Numba's cache in `__pycache__`) a single time.
+It also lets joblib workers import the NumPy fallback by name.
+"""
+
+import threading
+
+import numpy as np
+
+try:
+    import numba
+    from numba import prange
+    HAVE_NUMBA = True
+    # Streamlit runs every session in its own thread. TBB hangs the interpreter at exit once
+    # launched off the main thread and workqueue aborts on concurrent launches, so OpenMP
+    # goes first. The parallel kernel needs Numba built with OpenMP or TBB to run reliably
+    # under Streamlit; on workqueue alone `run_all_nb` still works, one launch at a time.
+    numba.config.THREADING_LAYER_PRIORITY = ['omp', 'tbb', 'workqueue']
+except ImportError:
+    prange = range
+    HAVE_NUMBA = False
+
+RNG_BATCH_SIZE = 8192  # Mating attempts drawn per batch by the NumPy fallback
+
+# Serializes launches of the parallel kernel across Streamlit's session threads
+_launch_lock = threading.Lock()
+
+def _jit(*signatures, **options):
+    """Compiles a function with Numba when it is installed, otherwise leaves it as plain Python."""
+    if HAVE_NUMBA:
+        return numba.njit(*signatures, **options)
+    return lambda func: func
+
+# Explicit signatures compile the kernels (or load them from the on-disk cache) as soon as
+# the app loads, instead of stalling the first click on Run Simulation
+@_jit('void(i8, i8, f8, f8, i8, i4[:, :])', cache=True, fastmath=True)
+def simulate_matings_nb(n_females, target, p_unpreg, p_preg, seed, stats):
+    """
+    Numba-compiled heart of the lovefest: one mating attempt at a time, at native speed.
+
+    Writes per-female counts into `stats`, shaped (3, n_females), whose rows are the
+    total, while-pregnant and while-unpregnant sessions. Pregnant sows are never rolled
+    for, so `p_preg` only keeps the signature in step with `simulate_matings`.
+    """
+    np.random.seed(seed)
+    stats[:] = 0
+    # One bit per sow: 64 pregnancy flags per word keeps the whole herd in L1 cache
+    pregnant = np.zeros((n_females + 63) >> 6, dtype=np.uint64)
+    target = min(target, n_females)
+    knocked_up = 0
+
+    while knocked_up < target:
+        lucky_sow = np.random.randint(0, n_females)
+        word = lucky_sow >> 6
+        bit = np.uint64(1) << np.uint64(lucky_sow & 63)
+
+        stats[0, lucky_sow] += 1
+        if pregnant[word] & bit:
+            # A pregnant sow can't conceive again, so her session is only counted
+            stats[1, lucky_sow] += 1
+            continue
+
+        stats[2, lucky_sow] += 1
+        if np.random.random() < p_unpreg:
+            pregnant[word] |= bit
+            knocked_up += 1
+
+@_jit('i4[:, ::1](i8[::1], i8, i8, f8, f8, i8[::1])', parallel=True, cache=True, fastmath=True)
+def _run_all_nb(populations, target, simulations, p_unpreg, p_preg, base_seeds):
+    """
+    Runs every simulation of every population in one parallel sweep across CPU cores.
+
+    Simulation `sim` of population `i` is seeded with `base_seeds[i] + sim`.
+
+    Returns:
+    - np.ndarray: Total, while-pregnant and while-unpregnant counts, shaped (3, rows); each
+      population fills a block of simulations x n_females rows, one simulation after another.
+    """
+    n_pops = len(populations)
+    offsets = np.zeros(n_pops + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(populations * simulations)
+    stats = np.empty((3, offsets[-1]), dtype=np.int32)
+    # Interleaving the populations spreads small, slow herds and big, quick ones evenly over the cores
+    for k in prange(n_pops * simulations):
+        pop, sim = k % n_pops, k // n_pops
+        n_females = populations[pop]
+        start = offsets[pop] + sim * n_females
+        simulate_matings_nb(n_females, target, p_unpreg, p_preg, base_seeds[pop] + sim,
+                            stats[:, start:start + n_females])
+    return stats
+
+def run_all_nb(populations, target, simulations, p_unpreg, p_preg, base_seeds):
+    """
+    Runs `_run_all_nb` under the launch lock, so concurrent sessions take turns on the cores.
+
+    Returns:
+    - np.ndarray: Total, while-pregnant and while-unpregnant counts, shaped (3, rows).
+    """
+    with _launch_lock:
+        return _run_all_nb(populations, target, simulations, p_unpreg, p_preg, base_seeds)
+
+def simulate_matings_np(n_females, target, p_unpreg, seed, stats, batch_size=RNG_BATCH_SIZE):
+    """
+    Pure NumPy fallback for when Numba is not around to do the romancing.
+
+    Rather than courting one sow at a time, Randy's attempts are drawn in batches
+    of `batch_size` and tallied with NumPy, stopping exactly at the attempt that
+    delivers the final required pregnancy. Counts are written into `stats` exactly
+    as `simulate_matings_nb` does.
+    """
+    rng = np.random.Generator(np.random.PCG64(seed))
+    total, while_preg, while_unpreg = stats
+    stats[:] = 0
+    pregnant = np.zeros(n_females, dtype=bool)
+    still_needed = min(target, n_females)
+
+    while still_needed > 0:
+        picks = rng.integers(0, n_females, size=batch_size)
+        rolls = rng.random(size=batch_size)
+        is_preg = pregnant[picks]
+
+        # Only a sow's first successful snuggle within the batch is a conception
+        hits = np.flatnonzero(~is_preg & (rolls < p_unpreg))
+        _, first_hit = np.unique(picks[hits], return_index=True)
+        conceptions = np.sort(hits[first_hit])
+
+        if len(conceptions) >= still_needed:
+            conceptions = conceptions[:still_needed]
+            stop = conceptions[-1] + 1
+        else:
+            stop = batch_size
+        picks = picks[:stop]
+
+        # Attempts after a sow conceived earlier in this batch also count as pregnant
+        conceived_at = np.full(n_females, stop)
+        conceived_at[picks[conceptions]] = conceptions
+        is_preg = is_preg[:stop] | (np.arange(stop) > conceived_at[picks])
+
+        total += np.bincount(picks, minlength=n_females)
+        while_preg += np.bincount(picks[is_preg], minlength=n_females)
+        pregnant[picks[conceptions]] = True
+        still_needed -= len(conceptions)
+
+    np.subtract(total, while_preg, out=while_unpreg)
+
+def simulate_chunk_np(n_females, target, p_unpreg, base_seed, sims):
+    """
+    Runs the NumPy fallback for the simulation indices in `sims`, seeding each with `base_seed + sim`.
+
+    Returns:
+    - np.ndarray: Total, while-pregnant and while-unpregnant counts, shaped (3, len(sims), n_females).
+    """
+    stats = np.empty((3, len(sims), n_females), dtype=np.int32)
+    for i, sim in enumerate(sims):
+        simulate_matings_np(n_females, target, p_unpreg, base_seed + sim, stats[:, i])
+    return stats